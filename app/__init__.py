@@ -1,12 +1,38 @@
+import argparse
 import typing
 
-from PySide2.QtGui import QFont, QIcon
-from PySide2.QtWidgets import QApplication
 
-from .widgets import MainWindow
+def parse_args(argv: typing.Optional[typing.List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="main.py")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="print module output instead of showing the overlay",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="print a single update and exit"
+    )
+    parser.add_argument("--format", choices=("text", "html", "json"), default="text")
+    parser.add_argument(
+        "--interval", type=float, default=1, help="seconds between updates"
+    )
+    parser.add_argument("--modules", nargs="+", metavar="NAME")
+    return parser.parse_args(argv)
 
 
 def main() -> typing.NoReturn:
+    args = parse_args()
+
+    if args.headless:
+        from .headless import run
+
+        exit(run(args))
+
+    from PySide2.QtGui import QFont, QIcon
+    from PySide2.QtWidgets import QApplication
+
+    from .widgets import MainWindow
+
     _ = QApplication()
     QApplication.setWindowIcon(QIcon("assets/images/icon.svg"))
     QApplication.setFont(QFont("新宋体", 12))
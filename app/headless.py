@@ -0,0 +1,87 @@
+import argparse
+import html
+import json
+import re
+import sys
+import time
+import typing
+
+from .sources.core import BaseSource
+from .modules.registry import discover_modules, get_enabled_modules, load_object
+from .settings import SettingsStore
+
+
+def to_text(content: str) -> str:
+    content = re.sub(r"<style.*?</style>", "", content, flags=re.DOTALL)
+    content = re.sub(r"<[^>]+>", " ", content)
+    return " ".join(html.unescape(content).split())
+
+
+def create_sources(
+    store: SettingsStore, names: typing.Optional[typing.List[str]]
+) -> typing.List[BaseSource]:
+    settings = store.namespace("Modules")
+    specs = discover_modules(settings)
+
+    sources = []
+    for name in names or get_enabled_modules(settings):
+        spec = specs.get(name)
+        if spec is None or spec.source is None:
+            print(f"No headless source for module: {name}", file=sys.stderr)
+            continue
+
+        source: BaseSource = load_object(spec.source)()
+        # The overlay or its workers record history, don't write it twice
+        source.persistent = False
+        source.load(store.namespace(name))
+        sources.append(source)
+
+    return sources
+
+
+def emit(sources: typing.Iterable[BaseSource], output_format: str):
+    if output_format == "json":
+        print(
+            json.dumps(
+                {
+                    "time": time.time(),
+                    "modules": {source.name: source.data() for source in sources},
+                },
+                ensure_ascii=False,
+            )
+        )
+    else:
+        for source in sources:
+            content = source.render()
+            if output_format == "text":
+                content = to_text(content)
+            print(f"[{source.name}] {content}")
+
+    sys.stdout.flush()
+
+
+def run(args: argparse.Namespace) -> int:
+    # A running overlay owns the settings file, only read it here
+    sources = create_sources(SettingsStore(read_only=True), args.modules)
+    if not sources:
+        return 1
+
+    # Fetches run in the background, wait for the first round to settle
+    for source in sources:
+        source.tick()
+    while any(source.pending for source in sources):
+        time.sleep(0.05)
+        for source in sources:
+            source.tick()
+    emit(sources, args.format)
+    if args.once:
+        return 0
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            changed = [source for source in sources if source.tick()]
+            if changed:
+                emit(changed, args.format)
+    except KeyboardInterrupt:
+        return 0
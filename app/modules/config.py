@@ -3,9 +3,40 @@ MINUTE_IN_SECONDS = 60
 HOUR_IN_SECONDS = MINUTE_IN_SECONDS * 60
 DAY_IN_SECONDS = HOUR_IN_SECONDS * 24
 
+SETTINGS_FILENAME = "settings.json"
+LEGACY_SETTINGS_FILENAME = "settings.ini"
+SETTINGS_FLUSH_INTERVAL = 2
+
+MODULE_ENTRY_POINT_GROUP = "desktop_toolbox.modules"
+SOURCE_ENTRY_POINT_GROUP = "desktop_toolbox.sources"
+WORKER_CONNECT_TIMEOUT = 5 * SECOND_IN_MILLISECONDS
+WORKER_RESTART_DELAY = 10
+
+TICK_INTERVAL = 200
+PAUSED_TICK_INTERVAL = 2 * SECOND_IN_MILLISECONDS
+IDLE_TIMEOUT = 10 * MINUTE_IN_SECONDS
+OCCLUSION_CHECK_INTERVAL = 1
+ADAPTIVE_DELAY_MAX_FACTOR = 8
+
+FETCH_TIMEOUT = (5, 10)
+FETCH_DEADLINE = 20
+FETCH_BACKOFF_BASE_DELAY = 5
+FETCH_BACKOFF_MAX_DELAY = 10 * MINUTE_IN_SECONDS
+FETCH_FAILURE_THRESHOLD = 6
+FETCH_CIRCUIT_OPEN_DELAY = 30 * MINUTE_IN_SECONDS
+
 DEFAULT_NEWS_SWITCH_DELAY = 15
 DEFAULT_NEWS_UPDATE_DELAY = 1 * HOUR_IN_SECONDS
 DEFAULT_WEATHER_UPDATE_DELAY = 5 * MINUTE_IN_SECONDS
+WEATHER_FORECAST_UPDATE_DELAY = 1 * HOUR_IN_SECONDS
+
+WEATHER_DAY_HISTORY_FILENAME = "weather_day.dat"
+WEATHER_DAY_HISTORY_RESOLUTION = 5 * MINUTE_IN_SECONDS
+WEATHER_WEEK_HISTORY_FILENAME = "weather_week.dat"
+WEATHER_WEEK_HISTORY_RESOLUTION = 1 * HOUR_IN_SECONDS
+SPARKLINE_WIDTH = 240
+SPARKLINE_HEIGHT = 40
+SPARKLINE_GAP = 1 * HOUR_IN_SECONDS
 
 DB_FILENAME = "countdown.db"
 
@@ -1,6 +1,6 @@
 import typing
 
-from PySide2.QtCore import QPoint, QSettings
+from PySide2.QtCore import QPoint
 from PySide2.QtGui import (
     QContextMenuEvent,
     QFont,
@@ -13,9 +13,20 @@ from PySide2.QtGui import (
 )
 from PySide2.QtWidgets import QAction, QFontDialog, QMenu, QVBoxLayout, QWidget
 
+from ..settings import SettingsNamespace, SettingsStore
 from ..util import restart_program
 
-settings = QSettings("settings.ini", QSettings.IniFormat)
+
+def to_point(value: typing.Any) -> QPoint:
+    """Converter for `SettingsNamespace.value`, rejects anything but [x, y]."""
+
+    if (
+        not isinstance(value, list)
+        or len(value) != 2
+        or not all(isinstance(i, int) for i in value)
+    ):
+        raise TypeError(f"not a position: {value!r}")
+    return QPoint(*value)
 
 
 class DelayValidator(QValidator):
@@ -51,21 +62,30 @@ class BaseModule(QWidget):
     def tick(self):
         ...
 
-    def load(self, settings: QSettings):
+    def set_active(self, active: bool):
+        ...
+
+    def load(self, settings: SettingsNamespace):
         ...
 
-    def save(self, settings: QSettings):
+    def save(self, settings: SettingsNamespace):
         ...
 
 
 class ModuleContainer(QWidget):
-    def __init__(self, parent: typing.Optional[QWidget], module: BaseModule) -> None:
+    def __init__(
+        self,
+        parent: typing.Optional[QWidget],
+        module: BaseModule,
+        settings: SettingsStore,
+    ) -> None:
         super().__init__(parent)
         self.setContextMenuPolicy(Qt.DefaultContextMenu)
         self.dragPosition = QPoint()
 
         self.module = module
         self.module.setParent(self)
+        self.settings = settings.namespace(self.module.name)
 
         self.menu = QMenu(self)
 
@@ -80,23 +100,26 @@ class ModuleContainer(QWidget):
         self.font_action.triggered.connect(self.onFontAction)
 
     def load(self):
-        global settings
+        self.move(self.settings.value("pos", QPoint(0, 0), to_point))
 
-        self.move(settings.value(f"{self.module.name}/pos", QPoint()))  # type: ignore
-        self.setFont(
-            settings.value(f"{self.module.name}/font", QFont())  # type: ignore
-        )
+        font = QFont()
+        font_description = self.settings.value("font", type=str)
+        if font_description:
+            font.fromString(font_description)
+        self.setFont(font)
         self.TITLE_BAR_HEIGHT = round(self.font().pointSize() * 3) + 10
 
-        self.module.load(settings)
+        self.module.load(self.settings)
 
-    def save(self):
-        global settings
+    def save_pos(self):
+        pos = self.mapToParent(QPoint())
+        self.settings.set_value("pos", [pos.x(), pos.y()])
 
-        settings.setValue(f"{self.module.name}/pos", self.mapToParent(QPoint()))
-        settings.setValue(f"{self.module.name}/font", self.font())
+    def save(self):
+        self.save_pos()
+        self.settings.set_value("font", self.font().toString())
 
-        self.module.save(settings)
+        self.module.save(self.settings)
 
     def onFontAction(self):
         dialog = QFontDialog(self.font(), self)
@@ -104,6 +127,7 @@ class ModuleContainer(QWidget):
         dialog.adjustPosition(self)
         if dialog.exec_() == QFontDialog.Accepted:
             self.setFont(dialog.currentFont())
+            self.settings.set_value("font", self.font().toString())
             restart_program()
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
@@ -114,6 +138,9 @@ class ModuleContainer(QWidget):
         self.module.tick()
         self.adjustSize()
 
+    def set_active(self, active: bool):
+        self.module.set_active(active)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         p = QPainter(self)
         p.fillRect(0, 0, self.width(), self.TITLE_BAR_HEIGHT, Qt.GlobalColor.cyan)
@@ -140,5 +167,6 @@ class ModuleContainer(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if event.buttons() == Qt.LeftButton:
             self.move(event.globalPos() - self.dragPosition)
+            self.save_pos()
 
         return super().mouseMoveEvent(event)
@@ -1,11 +1,5 @@
-import sqlite3
 import traceback
-import typing
-from collections import namedtuple
-from datetime import datetime
 
-from jinja2 import Template
-from PySide2.QtCore import QObject, QSettings
 from PySide2.QtGui import QContextMenuEvent, QIcon, Qt
 from PySide2.QtWidgets import (
     QAction,
@@ -22,81 +16,12 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
+from ..settings import SettingsNamespace
+from ..sources.countdown import Countdown, CountdownSource
 from ..util import restart_program
-from .config import (
-    DAY_IN_SECONDS,
-    DB_ADD_COUNTDOWN,
-    DB_CREATE_TABLE_COMMAND,
-    DB_DELETE_COUNTDOWN,
-    DB_FILENAME,
-    HOUR_IN_SECONDS,
-    MINUTE_IN_SECONDS,
-)
 from .core import BaseModule, DateValidator
 
 
-class Countdown(namedtuple("Countdown", ["name", "year", "month", "day"])):
-    with open("./assets/labels/Countdown.html", "r", encoding="utf-8") as f:
-        TEMPLATE = Template(f.read())
-
-    @property
-    def datetime(self):
-        if not hasattr(self, "_datetime"):
-            self._datetime = datetime(self.year, self.month, self.day, 0, 0, 0)
-        return self._datetime
-
-    def get_delta(self) -> typing.Dict[str, typing.Union[int, str]]:
-        delta = (self.datetime - datetime.now()).total_seconds()
-
-        days, delta = divmod(delta, DAY_IN_SECONDS)
-        hours, delta = divmod(delta, HOUR_IN_SECONDS)
-        minutes, delta = divmod(delta, MINUTE_IN_SECONDS)
-        seconds, delta = divmod(delta, 1)
-
-        return {
-            "name": self.name,
-            "days": round(days),
-            "hours": round(hours),
-            "minutes": round(minutes),
-            "seconds": round(seconds),
-        }
-
-    def render_template(self):
-        return Countdown.TEMPLATE.render(self.get_delta())
-
-
-class CountdownManager(QObject):
-    def __init__(self, parent: QObject) -> None:
-        super().__init__(parent)
-        self.db = sqlite3.connect(DB_FILENAME)
-        self.cursor = self.db.cursor()
-
-        self.create_table()
-
-    def create_table(self):
-        self.cursor.execute(DB_CREATE_TABLE_COMMAND)
-
-    def add_countdown(self, countdown: Countdown):
-        self.cursor.execute(
-            DB_ADD_COUNTDOWN
-            % (countdown.name, countdown.year, countdown.month, countdown.day)
-        )
-        self.db.commit()
-
-    def get_countdowns(self):
-        self.cursor.execute("SELECT * from countdown")
-        for row in self.cursor.fetchall():
-            yield Countdown(*row)
-
-    def delete_countdown(self, name: str):
-        self.cursor.execute(DB_DELETE_COUNTDOWN % name)
-
-    def close(self):
-        self.cursor.close()
-        self.db.commit()
-        self.db.close()
-
-
 class AddDialog(QDialog):
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
@@ -182,7 +107,7 @@ class CountdownModule(BaseModule):
         self.setContextMenuPolicy(Qt.DefaultContextMenu)
 
         self.labels: list[QLabel] = []
-        self.countdowns: list[Countdown] = []
+        self.source = CountdownSource()
 
         self.menu = QMenu(self)
 
@@ -197,11 +122,12 @@ class CountdownModule(BaseModule):
         self.add_action.triggered.connect(self.onAddAction)
         self.delete_action.triggered.connect(self.onDeleteAction)
 
-        self.manager = CountdownManager(self)
-
     def tick(self):
-        for i, countdown in enumerate(self.countdowns):
-            self.labels[i].setText(countdown.render_template())
+        if not self.source.tick():
+            return
+
+        for label, countdown in zip(self.labels, self.source.countdowns):
+            label.setText(countdown.render_template())
 
     def onAddAction(self):
         dialog = AddDialog(self)
@@ -214,7 +140,7 @@ class CountdownModule(BaseModule):
                     int(dialog.day_input.text()),
                 )
                 countdown.get_delta()
-                self.manager.add_countdown(countdown)
+                self.source.manager.add_countdown(countdown)
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -226,27 +152,27 @@ class CountdownModule(BaseModule):
 
     def onDeleteAction(self):
         dialog = DeleteDialog(
-            self, tuple(countdown.name for countdown in self.countdowns)
+            self, tuple(countdown.name for countdown in self.source.countdowns)
         )
         if dialog.exec_() == QDialog.Accepted:
             for selected in dialog.get_selected():
-                self.manager.delete_countdown(selected)
+                self.source.manager.delete_countdown(selected)
             restart_program()
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
         self.menu.exec_(event.globalPos())
 
-    def load(self, _: QSettings):
-        countdowns = tuple(self.manager.get_countdowns())
-        if countdowns:
-            for countdown in countdowns:
+    def load(self, settings: SettingsNamespace):
+        self.source.load(settings)
+
+        if self.source.countdowns:
+            for _ in self.source.countdowns:
                 label = QLabel(self)
-                self.countdowns.append(countdown)
                 self.labels.append(label)
                 self.v.addWidget(label)
         else:
-            self.label = QLabel("暂无倒计时", self)
+            self.label = QLabel(self.source.render(), self)
             self.v.addWidget(self.label)
 
-    def save(self, _: QSettings):
-        self.manager.close()
+    def save(self, settings: SettingsNamespace):
+        self.source.save(settings)
@@ -1,12 +1,4 @@
-import json
-import re
-import time
-import typing
-from urllib.parse import unquote
-
-import requests
-from jinja2 import Template
-from PySide2.QtCore import QSettings, Qt
+from PySide2.QtCore import Qt
 from PySide2.QtGui import QContextMenuEvent, QIcon
 from PySide2.QtWidgets import (
     QAction,
@@ -21,21 +13,10 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
-from .config import DEFAULT_NEWS_SWITCH_DELAY, DEFAULT_NEWS_UPDATE_DELAY
+from ..settings import SettingsNamespace
+from ..sources.news import NewsSource
 from .core import BaseModule, DelayValidator
 
-with open("./assets/labels/News.html", "r", encoding="utf-8") as f:
-    TEMPLATE = Template(f.read())
-
-
-def get_news() -> typing.Iterable[dict]:
-    res = requests.get("https://top.baidu.com/board?tab=realtime")
-    assert res.status_code == 200
-
-    return json.loads(
-        unquote(re.findall(r"<!--s-data:(.*?)-->", res.text, re.DOTALL)[0])
-    )["data"]["cards"][0]["content"]
-
 
 class SettingsDialog(QDialog):
     def __init__(
@@ -86,9 +67,7 @@ class NewsModule(BaseModule):
         self.v = QVBoxLayout(self)
         self.v.addWidget(self.label)
 
-        self.last_switch_time = self.last_update_time = self.idx = 0
-        self.labels_content = []
-        self.update_news()
+        self.source = NewsSource()
 
         self.menu = QMenu(self)
 
@@ -99,57 +78,25 @@ class NewsModule(BaseModule):
 
         self.menu.addActions((self.settings_action,))
 
-    def load(self, settings: QSettings):
-        self.SWITCH_DELAY: float = settings.value(
-            f"{self.name}/switch_delay", DEFAULT_NEWS_SWITCH_DELAY, float
-        )  # type: ignore
-        self.UPDATE_DELAY: float = settings.value(
-            f"{self.name}/update_delay", DEFAULT_NEWS_UPDATE_DELAY, float
-        )  # type: ignore
-
-    def save(self, settings: QSettings):
-        settings.setValue(f"{self.name}/switch_delay", self.SWITCH_DELAY)
-        settings.setValue(f"{self.name}/update_delay", self.UPDATE_DELAY)
-
-    def update_news(self):
-        self.last_update_time = time.time()
-
-        self.labels_content.clear()
-        self.idx = 0
-        self.update_success = False
-
-        news = None
-        try:
-            news = get_news()
-        except AssertionError as e:
-            self.labels.append(f"错误: {e}")
-            return
-
-        for i, new in enumerate(news):
-            new.update({"i": i, "total": len(news)})  # type: ignore
-            self.labels_content.append(TEMPLATE.render(new))
-        self.update_success = True
-        self.switch_news(0)
-
-    def switch_news(self, idx: typing.Optional[int] = None):
-        self.last_switch_time = time.time()
-        self.idx = idx if idx is not None else (self.idx + 1) % len(self.labels_content)
-        self.label.setText(self.labels_content[self.idx])
+    def load(self, settings: SettingsNamespace):
+        self.settings = settings
+        self.source.load(settings)
 
-    def tick(self):
-        now = time.time()
-
-        if now - self.last_update_time > self.UPDATE_DELAY:
-            self.update_news()
+    def save(self, settings: SettingsNamespace):
+        self.source.save(settings)
 
-        if self.update_success and now - self.last_switch_time > self.SWITCH_DELAY:
-            self.switch_news()
+    def tick(self):
+        if self.source.tick():
+            self.label.setText(self.source.render())
 
     def onSettingsAction(self):
-        dialog = SettingsDialog(self, self.UPDATE_DELAY, self.SWITCH_DELAY)
+        dialog = SettingsDialog(
+            self, self.source.UPDATE_DELAY, self.source.SWITCH_DELAY
+        )
         if dialog.exec() == QDialog.Accepted:
-            self.UPDATE_DELAY = float(dialog.update_delay_input.text())
-            self.SWITCH_DELAY = float(dialog.switch_delay_input.text())
+            self.source.UPDATE_DELAY = float(dialog.update_delay_input.text())
+            self.source.SWITCH_DELAY = float(dialog.switch_delay_input.text())
+            self.save(self.settings)
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
         self.menu.exec_(event.globalPos())
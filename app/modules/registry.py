@@ -0,0 +1,95 @@
+import importlib
+import traceback
+import typing
+from importlib.metadata import entry_points
+
+from ..settings import SettingsNamespace
+from .config import MODULE_ENTRY_POINT_GROUP, SOURCE_ENTRY_POINT_GROUP
+
+if typing.TYPE_CHECKING:
+    from .core import BaseModule
+
+
+class ModuleSpec(typing.NamedTuple):
+    name: str
+    module: str
+    source: typing.Optional[str] = None
+
+
+BUILTIN_MODULES = (
+    ModuleSpec(
+        "Countdown",
+        "app.modules.countdown:CountdownModule",
+        "app.sources.countdown:CountdownSource",
+    ),
+    ModuleSpec("News", "app.modules.news:NewsModule", "app.sources.news:NewsSource"),
+    ModuleSpec(
+        "Weather",
+        "app.modules.weather:WeatherModule",
+        "app.sources.weather:WeatherSource",
+    ),
+)
+
+
+def load_object(target: str) -> typing.Any:
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def discover_modules(settings: SettingsNamespace) -> typing.Dict[str, ModuleSpec]:
+    """Built-in modules, then `desktop_toolbox.modules` entry points (with an
+    optional `desktop_toolbox.sources` entry point of the same name), then the
+    `extra` table of the Modules settings namespace."""
+
+    specs = {spec.name: spec for spec in BUILTIN_MODULES}
+
+    sources = {ep.name: ep.value for ep in entry_points(group=SOURCE_ENTRY_POINT_GROUP)}
+    for ep in entry_points(group=MODULE_ENTRY_POINT_GROUP):
+        specs[ep.name] = ModuleSpec(ep.name, ep.value, sources.get(ep.name))
+
+    for name, entry in settings.value("extra", {}, dict).items():
+        try:
+            specs[name] = parse_extra_module(name, entry)
+        except ValueError:
+            traceback.print_exc()
+
+    return specs
+
+
+def parse_extra_module(name: str, entry: typing.Any) -> ModuleSpec:
+    if not isinstance(entry, dict) or not isinstance(entry.get("module"), str):
+        raise ValueError(f"Module {name}: `module` must be a 'package.module:Class'")
+
+    source = entry.get("source")
+    if source is not None and not isinstance(source, str):
+        raise ValueError(f"Module {name}: `source` must be a 'package.module:Class'")
+
+    return ModuleSpec(name, entry["module"], source)
+
+
+def get_enabled_modules(settings: SettingsNamespace) -> typing.List[str]:
+    return settings.value("enabled", [spec.name for spec in BUILTIN_MODULES], list)
+
+
+def create_modules(settings: SettingsNamespace) -> typing.Iterator["BaseModule"]:
+    specs = discover_modules(settings)
+
+    enabled = get_enabled_modules(settings)
+    isolated = settings.value("isolated", [], list)
+    settings.set_value("enabled", enabled)
+    settings.set_value("isolated", isolated)
+
+    for name in enabled:
+        try:
+            spec = specs.get(name)
+            if spec is None:
+                raise KeyError(f"Unknown module: {name}")
+
+            if name in isolated and spec.source is not None:
+                from .remote import RemoteModule
+
+                yield RemoteModule(name, spec.source)
+            else:
+                yield load_object(spec.module)()
+        except Exception:
+            traceback.print_exc()
@@ -0,0 +1,212 @@
+import json
+import os
+import sys
+import time
+import typing
+
+from PySide2.QtCore import QProcess, Qt
+from PySide2.QtGui import QContextMenuEvent, QIcon
+from PySide2.QtNetwork import QLocalServer, QLocalSocket
+from PySide2.QtWidgets import (
+    QAction,
+    QDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QMenu,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..settings import SettingsNamespace
+from ..sources.history import Sample
+from .config import WORKER_RESTART_DELAY
+from .core import BaseModule, DelayValidator
+from .sparkline import SparklineForm
+
+
+class SettingsDialog(QDialog):
+    def __init__(
+        self, parent: QWidget, delays: typing.Dict[str, typing.Tuple[str, float]]
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Settings")
+        self.setWindowIcon(QIcon("assets/images/settings.svg"))
+
+        self.title_label = QLabel("<h4>Settings</h4>", self)
+        self.confirm_button = QPushButton("Confirm", self)
+        self.cancel_button = QPushButton("Cancel", self)
+
+        self.title_label.setAlignment(Qt.AlignCenter)
+
+        self.form = QFormLayout()
+        self.inputs: dict[str, QLineEdit] = {}
+        for key, (label, value) in delays.items():
+            delay_input = QLineEdit(str(value), self)
+            delay_input.setValidator(DelayValidator(delay_input))
+            self.inputs[key] = delay_input
+            self.form.addRow(label, delay_input)
+
+        self.button_layout = QHBoxLayout()
+        self.button_layout.addWidget(self.confirm_button)
+        self.button_layout.addWidget(self.cancel_button)
+
+        self.v = QVBoxLayout(self)
+        self.v.addWidget(self.title_label)
+        self.v.addLayout(self.form)
+        self.v.addLayout(self.button_layout)
+
+        self.confirm_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
+
+    def get_values(self) -> typing.Dict[str, float]:
+        return {key: float(line.text()) for key, line in self.inputs.items()}
+
+
+class RemoteModule(BaseModule):
+    """Thin proxy for a `BaseSource` hosted in a worker process (`app.worker`),
+    which streams rendered HTML back as JSON lines over a `QLocalSocket`."""
+
+    def __init__(self, name: str, source: str) -> None:
+        super().__init__(name)
+        self.setContextMenuPolicy(Qt.DefaultContextMenu)
+        self.setMinimumWidth(480)
+
+        self.source = source
+        self.settings: typing.Optional[SettingsNamespace] = None
+        self.stopping = False
+        self.active = True
+        self.delays: typing.Dict[str, typing.Tuple[str, float]] = {}
+        self.restart_time = 0.0
+
+        self.label = QLabel(self)
+        self.label.setAlignment(Qt.AlignCenter)
+        self.label.setWordWrap(True)
+        self.label.setOpenExternalLinks(True)
+
+        self.sparklines = SparklineForm()
+
+        self.v = QVBoxLayout(self)
+        self.v.addWidget(self.label)
+        self.v.addLayout(self.sparklines)
+
+        self.server_name = f"DesktopToolbox-{name}-{os.getpid()}"
+        self.server = QLocalServer(self)
+        QLocalServer.removeServer(self.server_name)
+        self.server.listen(self.server_name)
+        self.server.newConnection.connect(self.onNewConnection)
+        self.socket: typing.Optional[QLocalSocket] = None
+
+        self.menu = QMenu(self)
+
+        self.settings_action = QAction(
+            QIcon("assets/images/settings.svg"), "Settings", self.menu
+        )
+        self.settings_action.setEnabled(False)
+        self.settings_action.triggered.connect(self.onSettingsAction)
+
+        self.menu.addActions((self.settings_action,))
+
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.ForwardedChannels)
+        self.process.finished.connect(self.onProcessFinished)
+
+    def load(self, settings: SettingsNamespace):
+        self.settings = settings
+        self.start_worker()
+
+    def save(self, _: SettingsNamespace):
+        self.stopping = True
+        self.process.kill()
+        self.process.waitForFinished(1000)
+        self.server.close()
+
+    def start_worker(self):
+        self.process.start(
+            sys.executable,
+            ["-m", "app.worker", self.source, self.server_name, self.name],
+        )
+
+    def tick(self):
+        self.sparklines.tick()
+
+        if (
+            self.restart_time
+            and time.time() > self.restart_time
+            and self.process.state() == QProcess.NotRunning
+        ):
+            self.restart_time = 0.0
+            self.start_worker()
+
+    def onNewConnection(self):
+        if self.socket is not None:
+            self.socket.deleteLater()
+
+        self.socket = self.server.nextPendingConnection()
+        self.socket.readyRead.connect(self.onReadyRead)
+
+        # The worker waits for its settings before it starts ticking
+        self.send(
+            {
+                "settings": self.settings.values() if self.settings else {},
+                "active": self.active,
+            }
+        )
+
+    def set_active(self, active: bool):
+        # Paused workers stop ticking, so they stop fetching as well
+        self.active = active
+        self.send({"active": active})
+
+    def send(self, message: dict):
+        if self.socket is None:
+            return
+
+        payload = json.dumps(message, ensure_ascii=False)
+        self.socket.write((payload + "\n").encode("utf-8"))
+
+    def onReadyRead(self):
+        while self.socket is not None and self.socket.canReadLine():
+            # Ignore malformed messages, the worker may be untrusted
+            try:
+                self.handle(json.loads(bytes(self.socket.readLine()).decode("utf-8")))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+
+    def handle(self, message: dict):
+        if "html" in message:
+            self.label.setText(message["html"])
+
+        if "delays" in message:
+            self.delays = {
+                key: (label, value) for key, (label, value) in message["delays"].items()
+            }
+            self.settings_action.setEnabled(bool(self.delays))
+
+        if "series" in message:
+            for name, series in message["series"].items():
+                self.sparklines.set_series(
+                    name,
+                    [Sample(*sample) for sample in series["samples"]],
+                    float(series["span"]),
+                    float(series["resolution"]),
+                )
+
+    def onSettingsAction(self):
+        dialog = SettingsDialog(self, self.delays)
+        if dialog.exec() == QDialog.Accepted and self.settings is not None:
+            values = dialog.get_values()
+            self.settings.update(values)
+            self.send({"settings": values})
+
+    def contextMenuEvent(self, event: QContextMenuEvent) -> None:
+        self.menu.exec_(event.globalPos())
+
+    def onProcessFinished(self, exit_code: int, _: QProcess.ExitStatus):
+        if self.stopping:
+            return
+
+        self.label.setText(f"错误: {self.name} 进程已退出 ({exit_code})")
+        self.restart_time = time.time() + WORKER_RESTART_DELAY
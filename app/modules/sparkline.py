@@ -0,0 +1,115 @@
+import math
+import time
+import typing
+
+from PySide2.QtCore import QPointF, Qt
+from PySide2.QtGui import QPainter, QPen, QPixmap, QPolygonF
+from PySide2.QtWidgets import QFormLayout, QLabel
+
+from ..sources.history import Sample
+from .config import SPARKLINE_GAP, SPARKLINE_HEIGHT, SPARKLINE_WIDTH
+
+
+def split_runs(
+    samples: typing.Sequence[Sample], gap: float
+) -> typing.Iterator[typing.Sequence[Sample]]:
+    begin = 0
+    for i in range(1, len(samples)):
+        if samples[i].timestamp - samples[i - 1].timestamp > gap:
+            yield samples[begin:i]
+            begin = i
+    if begin < len(samples):
+        yield samples[begin:]
+
+
+def render_sparkline(
+    samples: typing.Sequence[Sample],
+    start: float,
+    end: float,
+    gap: float,
+    width: int,
+    height: int,
+):
+    """Plot `samples` over the whole `start`..`end` window, breaking the line
+    wherever consecutive samples are more than `gap` seconds apart."""
+
+    pixmap = QPixmap(width, height)
+    pixmap.fill(Qt.transparent)
+
+    if not samples:
+        return pixmap
+
+    duration = (end - start) or 1
+
+    p = QPainter(pixmap)
+    p.setRenderHint(QPainter.Antialiasing)
+
+    for field, color in (("temperature", Qt.red), ("humidity", Qt.blue)):
+        values = [getattr(sample, field) for sample in samples]
+        low = min(values)
+        extent = (max(values) - low) or 1
+
+        def point(sample: Sample) -> QPointF:
+            return QPointF(
+                (sample.timestamp - start) / duration * (width - 1),
+                (1 - (getattr(sample, field) - low) / extent) * (height - 1),
+            )
+
+        p.setPen(QPen(color, 1.5))
+        for run in split_runs(samples, gap):
+            if len(run) == 1:
+                p.drawPoint(point(run[0]))
+            else:
+                p.drawPolyline(QPolygonF([point(sample) for sample in run]))
+
+    p.end()
+    return pixmap
+
+
+class SparklineForm(QFormLayout):
+    """One labelled sparkline row per series, added the first time a series
+    is set and redrawn when its samples change or go stale."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.labels: dict[str, QLabel] = {}
+        self.series: dict[str, typing.Tuple[typing.List[Sample], float, float]] = {}
+        self.expiries: dict[str, float] = {}
+
+    def set_series(
+        self, name: str, samples: typing.List[Sample], span: float, resolution: float
+    ):
+        if name not in self.labels:
+            label = QLabel()
+            label.setFixedSize(SPARKLINE_WIDTH, SPARKLINE_HEIGHT)
+            self.labels[name] = label
+            self.addRow(name, label)
+
+        self.series[name] = (samples, span, resolution)
+        self.draw(name, time.time())
+
+    def tick(self):
+        # Redraw once the oldest plotted sample falls out of its window, so a
+        # long fetch outage cannot leave stale data on screen
+        now = time.time()
+        for name, expiry in list(self.expiries.items()):
+            if now > expiry:
+                self.draw(name, now)
+
+    def draw(self, name: str, now: float):
+        samples, span, resolution = self.series[name]
+        start = now - span
+        samples = [sample for sample in samples if sample.timestamp >= start]
+
+        self.labels[name].setPixmap(
+            render_sparkline(
+                samples,
+                start,
+                now,
+                max(SPARKLINE_GAP, 2 * resolution),
+                SPARKLINE_WIDTH,
+                SPARKLINE_HEIGHT,
+            )
+        )
+        self.expiries[name] = samples[0].timestamp + span if samples else math.inf
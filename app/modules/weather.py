@@ -1,9 +1,6 @@
-import time
 import typing
 
-import requests
-from jinja2 import Template
-from PySide2.QtCore import QSettings, Qt
+from PySide2.QtCore import Qt
 from PySide2.QtGui import QContextMenuEvent, QIcon
 from PySide2.QtWidgets import (
     QAction,
@@ -18,28 +15,10 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
-from .config import DEFAULT_WEATHER_UPDATE_DELAY
+from ..settings import SettingsNamespace
+from ..sources.weather import TEMPLATE, WeatherSource
 from .core import BaseModule, DelayValidator
-
-with open("./assets/labels/Weather.html", "r", encoding="utf-8") as f:
-    TEMPLATE = Template(f.read())
-
-with open("./assets/labels/CurrentWeather.html", "r", encoding="utf-8") as f:
-    CURRENT_WEATHER_TEMPLATE = Template(f.read())
-
-
-def get_weathers(mode: typing.Literal["base"] | typing.Literal["all"]):
-    res = requests.get(
-        "https://restapi.amap.com/v3/weather/weatherInfo",
-        params={
-            "key": "3ab10d97bfed9358845a8b181b6454cf",
-            "city": "330782",
-            "extensions": mode,
-            "output": "json",
-        },
-    )
-    assert res.status_code == 200
-    return res.json()
+from .sparkline import SparklineForm
 
 
 class SettingsDialog(QDialog):
@@ -79,25 +58,21 @@ class WeatherModule(BaseModule):
 
         self.current_weather_label = QLabel(self)
         self.current_weather_label.setAlignment(Qt.AlignCenter)
-        self.update_weather()
 
         self.v = QVBoxLayout(self)
         self.v.addWidget(self.current_weather_label)
 
-        self.labels = []
+        self.labels: list[QLabel] = []
+        self.live: typing.Optional[dict] = None
+        self.error: typing.Optional[str] = None
+        self.casts: list[dict] = []
 
-        weathers = None
-        try:
-            weathers = get_weathers("all")["forecasts"][0]["casts"]
-        except AssertionError as e:
-            self.current_weather_label.setText(f"错误: {e}")
-            return
+        self.source = WeatherSource()
 
-        for weather in weathers:
-            label = QLabel(TEMPLATE.render(weather), self)
-            label.setAlignment(Qt.AlignCenter)
-            self.labels.append(label)
-            self.v.addWidget(label)
+        self.sparklines = SparklineForm()
+        self.v.addLayout(self.sparklines)
+        self.versions: dict[str, int] = {}
+        self.update_sparklines()
 
         self.menu = QMenu(self)
 
@@ -108,33 +83,61 @@ class WeatherModule(BaseModule):
 
         self.menu.addActions((self.settings_action,))
 
-    def load(self, settings: QSettings):
-        self.UPDATE_DELAY: float = settings.value(
-            f"{self.name}/update_delay", DEFAULT_WEATHER_UPDATE_DELAY, float
-        )  # type: ignore
+    def load(self, settings: SettingsNamespace):
+        self.settings = settings
+        self.source.load(settings)
 
-    def save(self, settings: QSettings):
-        settings.setValue(f"{self.name}/update_delay", self.UPDATE_DELAY)
+    def save(self, settings: SettingsNamespace):
+        self.source.save(settings)
 
     def tick(self):
-        now = time.time()
+        self.sparklines.tick()
+
+        changed = self.source.tick()
+        # Unchanged readings are recorded too, without counting as a change
+        self.update_sparklines()
+        if not changed:
+            return
+
+        if self.source.live is not self.live or self.source.error != self.error:
+            self.current_weather_label.setText(self.source.render_current())
+            self.live = self.source.live
+            self.error = self.source.error
+
+        if self.source.casts is not self.casts:
+            self.update_forecast(self.source.casts)
+
+    def update_sparklines(self):
+        for name, series in self.source.series().items():
+            if self.versions.get(name) != series.version:
+                self.versions[name] = series.version
+                self.sparklines.set_series(
+                    name, series.window(), series.span, series.resolution
+                )
+
+    def update_forecast(self, casts: list[dict]):
+        while len(self.labels) < len(casts):
+            label = QLabel(self)
+            label.setAlignment(Qt.AlignCenter)
+            self.labels.append(label)
+            self.v.addWidget(label)
+
+        for i, label in enumerate(self.labels):
+            if i >= len(casts):
+                label.hide()
+                continue
 
-        if now - self.last_update_time > self.UPDATE_DELAY:
-            self.update_weather()
+            if i >= len(self.casts) or self.casts[i] != casts[i]:
+                label.setText(TEMPLATE.render(casts[i]))
+            label.show()
 
-    def update_weather(self):
-        self.last_update_time = time.time()
-        try:
-            self.current_weather_label.setText(
-                CURRENT_WEATHER_TEMPLATE.render(get_weathers("base")["lives"][0])
-            )
-        except AssertionError as e:
-            self.current_weather_label.setText(f"错误: {e}")
+        self.casts = casts
 
     def onSettingsAction(self):
-        dialog = SettingsDialog(self, self.UPDATE_DELAY)
+        dialog = SettingsDialog(self, self.source.UPDATE_DELAY)
         if dialog.exec() == QDialog.Accepted:
-            self.UPDATE_DELAY = float(dialog.update_delay_input.text())
+            self.source.UPDATE_DELAY = float(dialog.update_delay_input.text())
+            self.save(self.settings)
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
         self.menu.exec_(event.globalPos())
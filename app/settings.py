@@ -0,0 +1,204 @@
+import json
+import os
+import sys
+import threading
+import traceback
+import typing
+
+from .modules.config import (
+    LEGACY_SETTINGS_FILENAME,
+    SETTINGS_FILENAME,
+    SETTINGS_FLUSH_INTERVAL,
+)
+
+T = typing.TypeVar("T")
+
+
+class SettingsNamespace:
+    def __init__(self, store: "SettingsStore", name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def value(
+        self,
+        key: str,
+        default: typing.Any = None,
+        type: typing.Optional[typing.Callable[[typing.Any], T]] = None,
+    ) -> typing.Any:
+        value = self.store.get(self.name, key)
+        if value is None:
+            return default
+        if type is None:
+            return value
+
+        try:
+            return type(value)
+        except (TypeError, ValueError):
+            return default
+
+    def set_value(self, key: str, value: typing.Any):
+        self.store.set(self.name, key, value)
+
+    def values(self) -> typing.Dict[str, typing.Any]:
+        return self.store.group(self.name)
+
+    def update(self, values: typing.Dict[str, typing.Any]):
+        for key, value in values.items():
+            self.set_value(key, value)
+
+
+class SettingsStore:
+    """In-memory settings cache flushed to a JSON file by a background thread.
+
+    Changes only mark the cache dirty; the flush thread coalesces them into at
+    most one atomic write per `flush_interval` seconds. A `read_only` store
+    (headless runs, workers) never writes, migrates or starts the thread."""
+
+    def __init__(
+        self,
+        filename: typing.Optional[str] = SETTINGS_FILENAME,
+        flush_interval: float = SETTINGS_FLUSH_INTERVAL,
+        read_only: bool = False,
+    ) -> None:
+        self.filename = os.path.abspath(filename) if filename is not None else None
+        self.flush_interval = flush_interval
+
+        self.values: dict[str, dict[str, typing.Any]] = {}
+        self.dirty = False
+        self.writable = not read_only
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+
+        self.wakeup = threading.Event()
+        self.closing = threading.Event()
+
+        if self.filename is not None:
+            self.load()
+
+        self.thread: typing.Optional[threading.Thread] = None
+        if not read_only:
+            self.thread = threading.Thread(
+                target=self.run, name="SettingsFlush", daemon=True
+            )
+            self.thread.start()
+
+    @classmethod
+    def snapshot(
+        cls, values: typing.Dict[str, typing.Dict[str, typing.Any]]
+    ) -> "SettingsStore":
+        store = cls(None, read_only=True)
+        store.values = values
+        return store
+
+    def namespace(self, name: str) -> SettingsNamespace:
+        return SettingsNamespace(self, name)
+
+    def group(self, namespace: str) -> typing.Dict[str, typing.Any]:
+        with self.lock:
+            return dict(self.values.get(namespace, {}))
+
+    def get(self, namespace: str, key: str) -> typing.Any:
+        with self.lock:
+            return self.values.get(namespace, {}).get(key)
+
+    def set(self, namespace: str, key: str, value: typing.Any):
+        with self.lock:
+            group = self.values.setdefault(namespace, {})
+            if group.get(key) == value:
+                return
+            group[key] = value
+            self.dirty = True
+        self.wakeup.set()
+
+    def load(self):
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                values = json.load(f)
+        except FileNotFoundError:
+            if self.writable and os.path.exists(LEGACY_SETTINGS_FILENAME):
+                self.import_legacy()
+            return
+        except OSError:
+            # Unreadable but possibly intact, never overwrite it this session
+            traceback.print_exc()
+            self.writable = False
+            return
+        except ValueError:
+            self.back_up_corrupt_file()
+            return
+
+        if isinstance(values, dict) and all(
+            isinstance(group, dict) for group in values.values()
+        ):
+            self.values = values
+        else:
+            self.back_up_corrupt_file()
+
+    def back_up_corrupt_file(self):
+        if not self.writable:
+            return
+
+        backup_filename = self.filename + ".bak"
+        print(f"Corrupt settings file, moved to {backup_filename}", file=sys.stderr)
+        try:
+            os.replace(self.filename, backup_filename)
+        except OSError:
+            traceback.print_exc()
+            self.writable = False
+
+        if os.path.exists(LEGACY_SETTINGS_FILENAME):
+            self.import_legacy()
+
+    def import_legacy(self):
+        # Qt is only needed for the one-off migration, keep it out of headless runs
+        from PySide2.QtCore import QPoint, QSettings
+        from PySide2.QtGui import QFont
+
+        settings = QSettings(LEGACY_SETTINGS_FILENAME, QSettings.IniFormat)
+        for group in settings.childGroups():
+            settings.beginGroup(group)
+            for key in settings.childKeys():
+                value = settings.value(key)
+                if isinstance(value, QPoint):
+                    value = [value.x(), value.y()]
+                elif isinstance(value, QFont):
+                    value = value.toString()
+                self.values.setdefault(group, {})[key] = value
+            settings.endGroup()
+        self.dirty = bool(self.values)
+
+    def run(self):
+        while not self.closing.is_set():
+            self.wakeup.wait()
+            # Debounce: let further changes accumulate before writing
+            self.closing.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty or not self.writable:
+                    return
+                data = json.dumps(self.values, ensure_ascii=False, indent=2)
+                self.dirty = False
+
+            tmp_filename = self.filename + ".tmp"
+            try:
+                with open(tmp_filename, "w", encoding="utf-8") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_filename, self.filename)
+            except OSError:
+                with self.lock:
+                    self.dirty = True
+
+    def close(self):
+        if self.thread is None:
+            return
+
+        self.closing.set()
+        self.wakeup.set()
+        self.thread.join()
+        self.flush()
@@ -0,0 +1,64 @@
+import json
+import typing
+
+from ..modules.config import ADAPTIVE_DELAY_MAX_FACTOR
+from ..settings import SettingsNamespace
+from .history import TimeSeries
+
+
+class AdaptiveDelay:
+    """Stretches a polling delay while successive payloads stay unchanged and
+    snaps back to the configured delay as soon as one differs."""
+
+    def __init__(self, max_factor: float = ADAPTIVE_DELAY_MAX_FACTOR) -> None:
+        self.max_factor = max_factor
+        self.factor = 1.0
+        self.digest: typing.Optional[int] = None
+
+    def __call__(self, delay: float) -> float:
+        return delay * self.factor
+
+    def feed(self, payload) -> bool:
+        digest = hash(json.dumps(payload, sort_keys=True, ensure_ascii=False))
+        changed = digest != self.digest
+        self.digest = digest
+
+        self.factor = 1.0 if changed else min(self.factor * 2, self.max_factor)
+        return changed
+
+
+class BaseSource:
+    """Widget-free half of a module: fetches data and renders it to HTML, so
+    it can also run in a worker process or without a GUI."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # Cleared by hosts that must not write the source's own data files
+        self.persistent = True
+
+    @property
+    def pending(self) -> bool:
+        return False
+
+    def tick(self) -> bool:
+        return False
+
+    def render(self) -> str:
+        return ""
+
+    def data(self) -> typing.Any:
+        return self.render()
+
+    def series(self) -> typing.Dict[str, TimeSeries]:
+        """Recorded history to plot, by display name."""
+        return {}
+
+    def delays(self) -> typing.Dict[str, typing.Tuple[str, float]]:
+        """User-editable delays as settings key -> (label, current value)."""
+        return {}
+
+    def load(self, settings: SettingsNamespace):
+        ...
+
+    def save(self, settings: SettingsNamespace):
+        ...
@@ -0,0 +1,131 @@
+import sqlite3
+import time
+import typing
+from collections import namedtuple
+from datetime import datetime
+
+from jinja2 import Template
+
+from ..modules.config import (
+    DAY_IN_SECONDS,
+    DB_ADD_COUNTDOWN,
+    DB_CREATE_TABLE_COMMAND,
+    DB_DELETE_COUNTDOWN,
+    DB_FILENAME,
+    HOUR_IN_SECONDS,
+    MINUTE_IN_SECONDS,
+)
+from ..settings import SettingsNamespace
+from .core import BaseSource
+
+
+class Countdown(namedtuple("Countdown", ["name", "year", "month", "day"])):
+    with open("./assets/labels/Countdown.html", "r", encoding="utf-8") as f:
+        TEMPLATE = Template(f.read())
+
+    @property
+    def datetime(self):
+        if not hasattr(self, "_datetime"):
+            self._datetime = datetime(self.year, self.month, self.day, 0, 0, 0)
+        return self._datetime
+
+    def get_delta(self) -> typing.Dict[str, typing.Union[int, str]]:
+        delta = (self.datetime - datetime.now()).total_seconds()
+
+        days, delta = divmod(delta, DAY_IN_SECONDS)
+        hours, delta = divmod(delta, HOUR_IN_SECONDS)
+        minutes, delta = divmod(delta, MINUTE_IN_SECONDS)
+        seconds, delta = divmod(delta, 1)
+
+        return {
+            "name": self.name,
+            "days": round(days),
+            "hours": round(hours),
+            "minutes": round(minutes),
+            "seconds": round(seconds),
+        }
+
+    def render_template(self):
+        return Countdown.TEMPLATE.render(self.get_delta())
+
+
+class CountdownManager:
+    def __init__(self, read_only: bool = False) -> None:
+        if read_only:
+            self.db = sqlite3.connect(f"file:{DB_FILENAME}?mode=ro", uri=True)
+        else:
+            self.db = sqlite3.connect(DB_FILENAME)
+        self.cursor = self.db.cursor()
+
+        if not read_only:
+            self.create_table()
+
+    def create_table(self):
+        self.cursor.execute(DB_CREATE_TABLE_COMMAND)
+
+    def add_countdown(self, countdown: Countdown):
+        self.cursor.execute(
+            DB_ADD_COUNTDOWN
+            % (countdown.name, countdown.year, countdown.month, countdown.day)
+        )
+        self.db.commit()
+
+    def get_countdowns(self):
+        self.cursor.execute("SELECT * from countdown")
+        for row in self.cursor.fetchall():
+            yield Countdown(*row)
+
+    def delete_countdown(self, name: str):
+        self.cursor.execute(DB_DELETE_COUNTDOWN % name)
+
+    def close(self):
+        self.cursor.close()
+        self.db.commit()
+        self.db.close()
+
+
+class CountdownSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__("Countdown")
+
+        # Opened in load, once the host has decided whether we may write
+        self.manager: typing.Optional[CountdownManager] = None
+        self.countdowns: typing.Tuple[Countdown, ...] = ()
+        self.last_second = 0
+
+    def load(self, _: SettingsNamespace):
+        if self.persistent:
+            self.manager = CountdownManager()
+            self.countdowns = tuple(self.manager.get_countdowns())
+            return
+
+        # Without a database there are simply no countdowns to show
+        try:
+            manager = CountdownManager(read_only=True)
+        except sqlite3.Error:
+            return
+        try:
+            self.countdowns = tuple(manager.get_countdowns())
+        except sqlite3.Error:
+            pass
+        finally:
+            manager.close()
+
+    def tick(self) -> bool:
+        second = int(time.time())
+        if second == self.last_second:
+            return False
+        self.last_second = second
+        return True
+
+    def render(self) -> str:
+        if not self.countdowns:
+            return "暂无倒计时"
+        return "".join(countdown.render_template() for countdown in self.countdowns)
+
+    def data(self) -> list:
+        return [countdown.get_delta() for countdown in self.countdowns]
+
+    def save(self, _: SettingsNamespace):
+        if self.manager is not None:
+            self.manager.close()
@@ -0,0 +1,141 @@
+import random
+import threading
+import time
+import typing
+from concurrent.futures import Future
+
+import requests
+
+from ..modules.config import (
+    FETCH_BACKOFF_BASE_DELAY,
+    FETCH_BACKOFF_MAX_DELAY,
+    FETCH_CIRCUIT_OPEN_DELAY,
+    FETCH_DEADLINE,
+    FETCH_FAILURE_THRESHOLD,
+)
+
+
+class FetchError(Exception):
+    ...
+
+
+def describe(error: BaseException) -> str:
+    """Short reason for the UI. The full error text of `requests` contains the
+    request URL, API key included, so it is never shown."""
+
+    if isinstance(error, (TimeoutError, requests.Timeout)):
+        return "请求超时"
+    if isinstance(error, requests.ConnectionError):
+        return "网络不可用"
+    # The fetchers assert on the HTTP status code
+    if isinstance(error, (AssertionError, requests.RequestException)):
+        return "请求失败"
+    return "数据无效"
+
+
+class FetchPolicy:
+    """Per-source retry state: exponential backoff with jitter after each
+    failure, and an open circuit that skips the source entirely once it has
+    failed `failure_threshold` times in a row.
+
+    Fetches run on a daemon thread and are collected with `poll`, so the
+    caller never blocks; one that has not finished within `deadline` seconds
+    is abandoned and counted as a failure, and no new fetch starts until its
+    thread has ended."""
+
+    def __init__(
+        self,
+        name: str,
+        base_delay: float = FETCH_BACKOFF_BASE_DELAY,
+        max_delay: float = FETCH_BACKOFF_MAX_DELAY,
+        failure_threshold: int = FETCH_FAILURE_THRESHOLD,
+        open_delay: float = FETCH_CIRCUIT_OPEN_DELAY,
+        deadline: float = FETCH_DEADLINE,
+    ) -> None:
+        self.name = name
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.open_delay = open_delay
+        self.deadline = deadline
+
+        self.future: typing.Optional[Future] = None
+        self.thread: typing.Optional[threading.Thread] = None
+        self.start_time = 0.0
+
+        self.failures = 0
+        self.retry_time = 0.0
+        self.last_error: typing.Optional[Exception] = None
+
+    @property
+    def circuit_open(self) -> bool:
+        return self.failures >= self.failure_threshold
+
+    @property
+    def pending(self) -> bool:
+        return self.future is not None
+
+    def ready(self, now: typing.Optional[float] = None) -> bool:
+        # A fetch abandoned at the deadline may still be running, wait for it so
+        # that there is never more than one thread per source
+        return (
+            not self.pending
+            and not (self.thread is not None and self.thread.is_alive())
+            and (now if now is not None else time.time()) >= self.retry_time
+        )
+
+    def submit(self, func: typing.Callable[..., typing.Any], *args, **kwargs):
+        future: Future = Future()
+
+        def run():
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        self.future = future
+        self.start_time = time.time()
+        self.thread = threading.Thread(
+            target=run, name=f"Fetch-{self.name}", daemon=True
+        )
+        self.thread.start()
+
+    def poll(self) -> typing.Optional[typing.Any]:
+        """Result of the submitted fetch once it is done, otherwise None."""
+
+        if self.future is None:
+            return None
+
+        if not self.future.done():
+            if time.time() - self.start_time < self.deadline:
+                return None
+            # Abandon it, the thread ends on its own once its sockets time out
+            self.future = None
+            error = TimeoutError(f"no response within {self.deadline} s")
+            self.record_failure(error)
+            raise FetchError(f"{self.name}: {describe(error)}")
+
+        future, self.future = self.future, None
+        try:
+            result = future.result()
+        except Exception as e:
+            # Parsing a malformed payload fails here too, count it the same way
+            self.record_failure(e)
+            raise FetchError(f"{self.name}: {describe(e)}") from e
+
+        self.failures = 0
+        self.retry_time = 0.0
+        self.last_error = None
+        return result
+
+    def record_failure(self, error: Exception):
+        self.failures += 1
+        self.last_error = error
+
+        if self.circuit_open:
+            delay = self.open_delay
+        else:
+            delay = min(self.max_delay, self.base_delay * 2 ** (self.failures - 1))
+            delay = delay / 2 + random.uniform(0, delay / 2)
+
+        self.retry_time = time.time() + delay
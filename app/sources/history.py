@@ -0,0 +1,102 @@
+import os
+import struct
+import time
+import typing
+from collections import deque
+
+# timestamp, temperature, humidity, number of readings averaged into the record
+RECORD = struct.Struct("<dffI")
+
+
+class Sample(typing.NamedTuple):
+    timestamp: float
+    temperature: float
+    humidity: float
+    count: int = 1
+
+
+class TimeSeries:
+    """Fixed-capacity series of readings averaged into `resolution` second
+    buckets, persisted as an append-only file of fixed-width records."""
+
+    def __init__(self, filename: str, resolution: float, capacity: int) -> None:
+        self.filename = filename
+        self.resolution = resolution
+        self.capacity = capacity
+
+        self.samples: deque[Sample] = deque(maxlen=capacity)
+        self.records_on_disk = 0
+        # Bumped on every append so readers can tell when to redraw
+        self.version = 0
+
+        self.load()
+
+    @property
+    def span(self) -> float:
+        return self.resolution * self.capacity
+
+    def bucket(self, sample: Sample) -> int:
+        return int(sample.timestamp // self.resolution)
+
+    def load(self):
+        try:
+            with open(self.filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return
+
+        # Drop a trailing partial record left behind by an interrupted write
+        data = data[: len(data) - len(data) % RECORD.size]
+        for record in RECORD.iter_unpack(data):
+            self.put(Sample(*record))
+        self.records_on_disk = len(data) // RECORD.size
+
+    def put(self, sample: Sample):
+        if self.samples and self.bucket(self.samples[-1]) == self.bucket(sample):
+            self.samples[-1] = sample
+        else:
+            self.samples.append(sample)
+
+    def append(self, timestamp: float, temperature: float, humidity: float):
+        sample = Sample(timestamp, temperature, humidity)
+
+        if self.samples and self.bucket(self.samples[-1]) == self.bucket(sample):
+            last = self.samples[-1]
+            count = last.count + 1
+            sample = Sample(
+                timestamp,
+                last.temperature + (temperature - last.temperature) / count,
+                last.humidity + (humidity - last.humidity) / count,
+                count,
+            )
+
+        self.put(sample)
+        self.write(sample)
+        self.version += 1
+
+    def write(self, sample: Sample):
+        if self.records_on_disk >= 2 * self.capacity:
+            self.compact()
+            return
+
+        try:
+            with open(self.filename, "ab") as f:
+                f.write(RECORD.pack(*sample))
+            self.records_on_disk += 1
+        except OSError:
+            pass
+
+    def compact(self):
+        tmp_filename = self.filename + ".tmp"
+        try:
+            with open(tmp_filename, "wb") as f:
+                for sample in self.samples:
+                    f.write(RECORD.pack(*sample))
+            os.replace(tmp_filename, self.filename)
+            self.records_on_disk = len(self.samples)
+        except OSError:
+            pass
+
+    def window(self, now: typing.Optional[float] = None) -> typing.List[Sample]:
+        start = (now if now is not None else time.time()) - self.span
+        return [sample for sample in self.samples if sample.timestamp >= start]
@@ -0,0 +1,129 @@
+import json
+import re
+import time
+import typing
+from urllib.parse import unquote
+
+import requests
+from jinja2 import Template
+
+from ..modules.config import (
+    DEFAULT_NEWS_SWITCH_DELAY,
+    DEFAULT_NEWS_UPDATE_DELAY,
+    FETCH_TIMEOUT,
+)
+from ..settings import SettingsNamespace
+from .core import AdaptiveDelay, BaseSource
+from .fetch import FetchError, FetchPolicy
+
+with open("./assets/labels/News.html", "r", encoding="utf-8") as f:
+    TEMPLATE = Template(f.read())
+
+
+def get_news() -> typing.Iterable[dict]:
+    res = requests.get(
+        "https://top.baidu.com/board?tab=realtime", timeout=FETCH_TIMEOUT
+    )
+    assert res.status_code == 200
+
+    return json.loads(
+        unquote(re.findall(r"<!--s-data:(.*?)-->", res.text, re.DOTALL)[0])
+    )["data"]["cards"][0]["content"]
+
+
+class NewsSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__("News")
+
+        self.SWITCH_DELAY: float = DEFAULT_NEWS_SWITCH_DELAY
+        self.UPDATE_DELAY: float = DEFAULT_NEWS_UPDATE_DELAY
+
+        self.last_switch_time = self.last_update_time = self.idx = 0
+        self.news: list[dict] = []
+        self.labels_content: list[str] = []
+        self.update_success = False
+        self.error: typing.Optional[str] = None
+        self.update_delay = AdaptiveDelay()
+        self.news_fetch = FetchPolicy("News")
+
+    def load(self, settings: SettingsNamespace):
+        self.SWITCH_DELAY = settings.value(
+            "switch_delay", DEFAULT_NEWS_SWITCH_DELAY, float
+        )
+        self.UPDATE_DELAY = settings.value(
+            "update_delay", DEFAULT_NEWS_UPDATE_DELAY, float
+        )
+
+    def save(self, settings: SettingsNamespace):
+        settings.set_value("switch_delay", self.SWITCH_DELAY)
+        settings.set_value("update_delay", self.UPDATE_DELAY)
+
+    @property
+    def pending(self) -> bool:
+        return self.news_fetch.pending
+
+    def delays(self) -> typing.Dict[str, typing.Tuple[str, float]]:
+        return {
+            "update_delay": ("Update Delay", self.UPDATE_DELAY),
+            "switch_delay": ("Switch Delay", self.SWITCH_DELAY),
+        }
+
+    def update_news(self) -> bool:
+        try:
+            news = self.news_fetch.poll()
+        except FetchError as e:
+            # Keep rotating through the last good headlines
+            if self.update_success:
+                return False
+            self.error = f"错误: {e}"
+            return True
+        if news is None:
+            return False
+        self.error = None
+
+        if not self.update_delay.feed(news) and self.update_success:
+            return False
+
+        self.news = list(news)
+        self.labels_content.clear()
+        for i, new in enumerate(news):
+            new.update({"i": i, "total": len(news)})  # type: ignore
+            self.labels_content.append(TEMPLATE.render(new))
+        self.update_success = bool(self.labels_content)
+        self.switch_news(0)
+        return True
+
+    def switch_news(self, idx: typing.Optional[int] = None):
+        self.last_switch_time = time.time()
+        self.idx = idx if idx is not None else (self.idx + 1) % len(self.labels_content)
+
+    def tick(self) -> bool:
+        now = time.time()
+        changed = False
+
+        if self.news_fetch.ready(now) and (
+            self.news_fetch.failures
+            or now - self.last_update_time > self.update_delay(self.UPDATE_DELAY)
+        ):
+            self.last_update_time = now
+            self.news_fetch.submit(get_news)
+        changed = self.update_news()
+
+        if self.update_success and now - self.last_switch_time > self.SWITCH_DELAY:
+            self.switch_news()
+            changed = True
+
+        return changed
+
+    def render(self) -> str:
+        if self.error is not None:
+            return self.error
+        if not self.update_success:
+            return ""
+        return self.labels_content[self.idx]
+
+    def data(self) -> dict:
+        return {
+            "error": self.error,
+            "headline": self.news[self.idx] if self.update_success else None,
+        }
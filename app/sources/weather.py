@@ -0,0 +1,187 @@
+import time
+import typing
+from datetime import date
+
+import requests
+from jinja2 import Template
+
+from ..modules.config import (
+    DAY_IN_SECONDS,
+    DEFAULT_WEATHER_UPDATE_DELAY,
+    FETCH_TIMEOUT,
+    WEATHER_DAY_HISTORY_FILENAME,
+    WEATHER_DAY_HISTORY_RESOLUTION,
+    WEATHER_FORECAST_UPDATE_DELAY,
+    WEATHER_WEEK_HISTORY_FILENAME,
+    WEATHER_WEEK_HISTORY_RESOLUTION,
+)
+from ..settings import SettingsNamespace
+from .core import AdaptiveDelay, BaseSource
+from .fetch import FetchError, FetchPolicy
+from .history import TimeSeries
+
+with open("./assets/labels/Weather.html", "r", encoding="utf-8") as f:
+    TEMPLATE = Template(f.read())
+
+with open("./assets/labels/CurrentWeather.html", "r", encoding="utf-8") as f:
+    CURRENT_WEATHER_TEMPLATE = Template(f.read())
+
+
+def get_weathers(mode: typing.Literal["base"] | typing.Literal["all"]):
+    res = requests.get(
+        "https://restapi.amap.com/v3/weather/weatherInfo",
+        params={
+            "key": "3ab10d97bfed9358845a8b181b6454cf",
+            "city": "330782",
+            "extensions": mode,
+            "output": "json",
+        },
+        timeout=FETCH_TIMEOUT,
+    )
+    assert res.status_code == 200
+    return res.json()
+
+
+class WeatherSource(BaseSource):
+    def __init__(self) -> None:
+        super().__init__("Weather")
+
+        self.UPDATE_DELAY: float = DEFAULT_WEATHER_UPDATE_DELAY
+
+        self.live: typing.Optional[dict] = None
+        self.casts: list[dict] = []
+        self.error: typing.Optional[str] = None
+
+        self.forecast_date = date.today()
+        self.last_update_time = self.last_forecast_update_time = 0
+
+        self.update_delay = AdaptiveDelay()
+        self.forecast_update_delay = AdaptiveDelay()
+        self.weather_fetch = FetchPolicy("Weather")
+        self.forecast_fetch = FetchPolicy("Forecast")
+
+        self.history = {
+            "24h": TimeSeries(
+                WEATHER_DAY_HISTORY_FILENAME,
+                WEATHER_DAY_HISTORY_RESOLUTION,
+                round(DAY_IN_SECONDS / WEATHER_DAY_HISTORY_RESOLUTION),
+            ),
+            "7d": TimeSeries(
+                WEATHER_WEEK_HISTORY_FILENAME,
+                WEATHER_WEEK_HISTORY_RESOLUTION,
+                round(7 * DAY_IN_SECONDS / WEATHER_WEEK_HISTORY_RESOLUTION),
+            ),
+        }
+
+    def load(self, settings: SettingsNamespace):
+        self.UPDATE_DELAY = settings.value(
+            "update_delay", DEFAULT_WEATHER_UPDATE_DELAY, float
+        )
+
+    def save(self, settings: SettingsNamespace):
+        settings.set_value("update_delay", self.UPDATE_DELAY)
+
+    def series(self) -> typing.Dict[str, TimeSeries]:
+        return self.history
+
+    def delays(self) -> typing.Dict[str, typing.Tuple[str, float]]:
+        return {"update_delay": ("Update Delay", self.UPDATE_DELAY)}
+
+    def tick(self) -> bool:
+        now = time.time()
+        changed = False
+
+        if self.weather_fetch.ready(now) and (
+            self.weather_fetch.failures
+            or now - self.last_update_time > self.update_delay(self.UPDATE_DELAY)
+        ):
+            self.last_update_time = now
+            self.weather_fetch.submit(lambda: get_weathers("base")["lives"][0])
+        changed |= self.update_weather()
+
+        if self.forecast_fetch.ready(now) and (
+            self.forecast_fetch.failures
+            or date.today() != self.forecast_date
+            or now - self.last_forecast_update_time
+            > self.forecast_update_delay(WEATHER_FORECAST_UPDATE_DELAY)
+        ):
+            self.last_forecast_update_time = now
+            self.forecast_date = date.today()
+            self.forecast_fetch.submit(
+                lambda: get_weathers("all")["forecasts"][0]["casts"]
+            )
+        changed |= self.update_forecast()
+
+        return changed
+
+    @property
+    def pending(self) -> bool:
+        return self.weather_fetch.pending or self.forecast_fetch.pending
+
+    def update_weather(self) -> bool:
+        try:
+            live = self.weather_fetch.poll()
+        except FetchError as e:
+            # Keep showing the last good reading if there is one
+            if self.live is not None:
+                return False
+            self.error = f"错误: {e}"
+            return True
+
+        if live is None:
+            return False
+
+        changed = self.error is not None
+        self.error = None
+
+        # Record every reading, unchanged ones still fill the history buckets
+        self.record_sample(live)
+
+        if self.update_delay.feed(live):
+            self.live = live
+            changed = True
+        return changed
+
+    def record_sample(self, live: dict):
+        if not self.persistent:
+            return
+
+        try:
+            temperature = float(live["temperature"])
+            humidity = float(live["humidity"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        for series in self.history.values():
+            series.append(self.last_update_time, temperature, humidity)
+
+    def update_forecast(self) -> bool:
+        try:
+            casts = self.forecast_fetch.poll()
+        except FetchError:
+            # Keep showing the previous forecast until the policy allows a retry
+            return False
+
+        if casts is None:
+            return False
+
+        if not self.forecast_update_delay.feed(casts):
+            return False
+
+        self.casts = casts
+        return True
+
+    def render_current(self) -> str:
+        if self.error is not None:
+            return self.error
+        if self.live is None:
+            return ""
+        return CURRENT_WEATHER_TEMPLATE.render(self.live)
+
+    def render(self) -> str:
+        return "".join(
+            [self.render_current(), *(TEMPLATE.render(cast) for cast in self.casts)]
+        )
+
+    def data(self) -> dict:
+        return {"error": self.error, "live": self.live, "casts": self.casts}
@@ -1,4 +1,7 @@
+import ctypes
+import ctypes.wintypes
 import sys
+import typing
 
 from PySide2.QtCore import QProcess
 from PySide2.QtWidgets import QApplication
@@ -13,3 +16,77 @@ def restart_program():
 
     QProcess.startDetached(sys.executable, sys.argv)
     QApplication.exit()
+
+
+GWL_EXSTYLE = -20
+WS_EX_TRANSPARENT = 0x00000020
+DWMWA_CLOAKED = 14
+
+
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+
+def get_idle_seconds() -> float:
+    if sys.platform != "win32":
+        return 0.0
+
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(info)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):  # type: ignore
+        return 0.0
+
+    ticks = ctypes.windll.kernel32.GetTickCount() & 0xFFFFFFFF  # type: ignore
+    return ((ticks - info.dwTime) & 0xFFFFFFFF) / 1000
+
+
+def is_session_locked() -> bool:
+    if sys.platform != "win32":
+        return False
+
+    # The secure desktop shown while locked cannot be opened by user processes
+    desktop = ctypes.windll.user32.OpenInputDesktop(0, False, 0x0100)  # type: ignore
+    if not desktop:
+        return True
+    ctypes.windll.user32.CloseDesktop(desktop)  # type: ignore
+    return False
+
+
+def get_windows_above(hwnd: int) -> typing.List[typing.Tuple[int, int, int, int]]:
+    """Screen rects (left, top, right, bottom) of the visible top-level windows
+    stacked above `hwnd`, topmost first. Only implemented on Windows."""
+
+    if sys.platform != "win32":
+        return []
+
+    user32 = ctypes.windll.user32  # type: ignore
+    dwmapi = ctypes.windll.dwmapi  # type: ignore
+    rects = []
+
+    def visit(other: int, _) -> bool:
+        if other == hwnd:
+            return False
+        if not user32.IsWindowVisible(other) or user32.IsIconic(other):
+            return True
+        # Click-through overlays do not hide what is below them
+        if user32.GetWindowLongW(other, GWL_EXSTYLE) & WS_EX_TRANSPARENT:
+            return True
+
+        cloaked = ctypes.c_int(0)
+        dwmapi.DwmGetWindowAttribute(
+            other, DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked)
+        )
+        if cloaked.value:
+            return True
+
+        rect = ctypes.wintypes.RECT()
+        if user32.GetWindowRect(other, ctypes.byref(rect)):
+            rects.append((rect.left, rect.top, rect.right, rect.bottom))
+        return True
+
+    # EnumWindows walks top-level windows in z-order, topmost first
+    callback = ctypes.WINFUNCTYPE(
+        ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
+    )(visit)
+    user32.EnumWindows(callback, 0)
+    return rects
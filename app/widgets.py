@@ -1,11 +1,19 @@
-from PySide2.QtCore import QTimer
-from PySide2.QtGui import QCloseEvent, QIcon, Qt
+import time
+
+from PySide2.QtCore import QRect, QTimer
+from PySide2.QtGui import QCloseEvent, QIcon, QRegion, Qt
 from PySide2.QtWidgets import QAction, QApplication, QMenu, QSystemTrayIcon, QWidget
 
+from .modules.config import (
+    IDLE_TIMEOUT,
+    OCCLUSION_CHECK_INTERVAL,
+    PAUSED_TICK_INTERVAL,
+    TICK_INTERVAL,
+)
 from .modules.core import ModuleContainer
-from .modules.countdown import CountdownModule
-from .modules.news import NewsModule
-from .modules.weather import WeatherModule
+from .modules.registry import create_modules
+from .settings import SettingsStore
+from .util import get_idle_seconds, get_windows_above, is_session_locked
 
 
 class MainWindow(QWidget):
@@ -27,17 +35,76 @@ class MainWindow(QWidget):
         self.tray.show()
         self.tray.setContextMenu(self.menu)
 
+        self.settings = SettingsStore()
         self.modules: list[ModuleContainer] = [
-            ModuleContainer(self, CountdownModule()),
-            ModuleContainer(self, NewsModule()),
-            ModuleContainer(self, WeatherModule()),
+            ModuleContainer(self, module, self.settings)
+            for module in create_modules(self.settings.namespace("Modules"))
         ]
 
+        self.active = True
+        self.covered = False
+        self.last_occlusion_check_time = 0.0
+
         self.tick_timer = QTimer(self)
         self.tick_timer.timeout.connect(self.tick)
-        self.tick_timer.start(1)
+        self.tick_timer.start(TICK_INTERVAL)
+
+    def is_overlay_visible(self) -> bool:
+        handle = self.windowHandle()
+        return (
+            self.isVisible()
+            and handle is not None
+            and handle.isExposed()
+            and not is_session_locked()
+            and get_idle_seconds() < IDLE_TIMEOUT
+            and not self.is_covered()
+        )
+
+    def is_covered(self) -> bool:
+        now = time.time()
+        if now - self.last_occlusion_check_time < OCCLUSION_CHECK_INTERVAL:
+            return self.covered
+        self.last_occlusion_check_time = now
+
+        # The window itself is a transparent full-screen layer, only the
+        # module containers on it can actually be seen
+        region = QRegion()
+        for module in self.modules:
+            region = region.united(QRegion(module.geometry().translated(self.pos())))
+
+        ratio = self.devicePixelRatioF()
+        for left, top, right, bottom in get_windows_above(int(self.winId())):
+            if region.isEmpty():
+                break
+            region = region.subtracted(
+                QRegion(
+                    QRect(
+                        round(left / ratio),
+                        round(top / ratio),
+                        round((right - left) / ratio),
+                        round((bottom - top) / ratio),
+                    )
+                )
+            )
+
+        self.covered = bool(self.modules) and region.isEmpty()
+        return self.covered
 
     def tick(self):
+        # Modules compare against their last update time, so the first tick
+        # after a pause performs a single catch-up update
+        active = self.is_overlay_visible()
+        if active != self.active:
+            self.active = active
+            self.tick_timer.setInterval(
+                TICK_INTERVAL if active else PAUSED_TICK_INTERVAL
+            )
+            for module in self.modules:
+                module.set_active(active)
+
+        if not active:
+            return
+
         for module in self.modules:
             module.tick()
 
@@ -48,5 +115,6 @@ class MainWindow(QWidget):
     def closeEvent(self, event: QCloseEvent) -> None:
         for module in self.modules:
             module.save()
+        self.settings.close()
 
         return super().closeEvent(event)
@@ -0,0 +1,112 @@
+import json
+import sys
+import typing
+
+from PySide2.QtCore import QCoreApplication, QObject, QTimer
+from PySide2.QtNetwork import QLocalSocket
+
+from .modules.config import TICK_INTERVAL, WORKER_CONNECT_TIMEOUT
+from .modules.registry import load_object
+from .settings import SettingsStore
+from .sources.core import BaseSource
+
+
+class Worker(QObject):
+    """Hosts a `BaseSource` for a `RemoteModule`. Settings arrive over the
+    socket, so the worker never touches the settings file the GUI owns."""
+
+    def __init__(self, source: BaseSource, name: str, socket: QLocalSocket) -> None:
+        super().__init__()
+
+        self.source = source
+        self.socket = socket
+        self.settings = SettingsStore.snapshot({}).namespace(name)
+        self.loaded = False
+        self.active = True
+        self.versions: typing.Dict[str, int] = {}
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+
+        self.socket.readyRead.connect(self.onReadyRead)
+
+    def send(self, message: dict):
+        payload = json.dumps(message, ensure_ascii=False)
+        self.socket.write((payload + "\n").encode("utf-8"))
+
+    def tick(self):
+        if self.source.tick():
+            self.send({"html": self.source.render()})
+        self.send_series()
+
+    def send_series(self):
+        # History is recorded here, the proxy only plots what it is sent
+        changed = {
+            name: series
+            for name, series in self.source.series().items()
+            if self.versions.get(name) != series.version
+        }
+        if not changed:
+            return
+
+        self.send(
+            {
+                "series": {
+                    name: {
+                        "span": series.span,
+                        "resolution": series.resolution,
+                        "samples": series.window(),
+                    }
+                    for name, series in changed.items()
+                }
+            }
+        )
+        for name, series in changed.items():
+            self.versions[name] = series.version
+
+    def handle(self, message: dict):
+        if "settings" in message:
+            self.settings.update(message["settings"])
+            self.source.load(self.settings)
+            self.loaded = True
+            self.send({"delays": self.source.delays()})
+
+        if "active" in message:
+            self.active = bool(message["active"])
+
+        self.update_timer()
+
+    def update_timer(self):
+        if not self.loaded or not self.active:
+            self.timer.stop()
+        elif not self.timer.isActive():
+            self.timer.start(TICK_INTERVAL)
+            self.tick()
+
+    def onReadyRead(self):
+        while self.socket.canReadLine():
+            try:
+                message = json.loads(bytes(self.socket.readLine()).decode("utf-8"))
+            except ValueError:
+                continue
+            self.handle(message)
+
+
+def main(argv: typing.List[str]) -> typing.NoReturn:
+    target, server_name, name = argv
+
+    app = QCoreApplication(sys.argv[:1])
+
+    socket = QLocalSocket()
+    socket.connectToServer(server_name)
+    if not socket.waitForConnected(WORKER_CONNECT_TIMEOUT):
+        exit(1)
+    socket.disconnected.connect(app.quit)
+
+    _ = Worker(load_object(target)(), name, socket)
+
+    exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])